@@ -1,7 +1,5 @@
 import streamlit as st
 import tempfile
-import subprocess
-import sys
 from pathlib import Path
 import pandas as pd
 
@@ -12,6 +10,42 @@ st.set_page_config(
     layout="wide"
 )
 
+
+@st.cache_resource
+def load_analyzer():
+    # Import predict (and pandas/numpy/matplotlib with it) once per server process,
+    # and load its Numba kernels before the first upload needs them
+    from predict import analyze_to_pdf, warm_kernels
+    warm_kernels()
+    return analyze_to_pdf
+
+
+# Streamlit reruns this script on every widget interaction; the caches below are keyed
+# on the upload's file_id so parsing and report generation only rerun for a new file.
+# Arguments starting with "_" are left out of the cache key.
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def load_upload(file_id: str, _uploaded) -> pd.DataFrame:
+    try:
+        return pd.read_csv(_uploaded, engine="pyarrow", dtype_backend="pyarrow")
+    except pd.errors.ParserError:
+        # Ragged rows: the C parser pads them with NaN where pyarrow refuses
+        _uploaded.seek(0)
+        return pd.read_csv(_uploaded, dtype_backend="pyarrow")
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def build_report(file_id: str, _df: pd.DataFrame) -> bytes:
+    # Runs in-process without redirecting stdout/stderr: those are process-wide, so
+    # concurrent sessions would capture each other's output (and cache it). Failures
+    # propagate to the caller, which shows the full traceback.
+    analyze_to_pdf = load_analyzer()
+    with tempfile.TemporaryDirectory() as workdir:
+        out_path = Path(workdir) / "report.pdf"
+        analyze_to_pdf(_df, str(out_path))
+        return out_path.read_bytes() if out_path.exists() else b""
+
+
 # ---------- CUSTOM STYLING ---------- #
 st.markdown(
     """
@@ -33,8 +67,8 @@ st.markdown("<p class='subtitle'>Upload a CSV and generate a polished PDF EDA re
 uploaded = st.file_uploader("📂 Upload your CSV file", type=["csv"], accept_multiple_files=False)
 
 if uploaded is not None:
-    # Preview dataset info
-    df = pd.read_csv(uploaded, nrows=500)
+    # Parse the upload once; the same frame feeds the preview and the report
+    df = load_upload(uploaded.file_id, uploaded)
     st.success(f"✅ File `{uploaded.name}` uploaded successfully!")
 
     with st.expander("🔍 Quick Dataset Preview", expanded=True):
@@ -43,48 +77,24 @@ if uploaded is not None:
         st.dataframe(df.head(10), use_container_width=True)
 
     # ---------- PROCESS PDF ---------- #
-    with tempfile.TemporaryDirectory() as workdir:
-        in_path = Path(workdir) / uploaded.name
-        out_path = Path(workdir) / "report.pdf"
+    try:
+        with st.spinner("⏳ Running analysis... This may take a few seconds."):
+            pdf_bytes = build_report(uploaded.file_id, df)
+    except Exception as e:
+        st.error("❌ Analysis failed.")
+        st.exception(e)
+        st.stop()
+
+    if not pdf_bytes:
+        st.error("⚠️ PDF report was not created.")
+        st.stop()
+    st.success("🎉 Analysis complete — report generated.")
 
-        with open(in_path, "wb") as f:
-            f.write(uploaded.getbuffer())
-
-        python_exe = sys.executable
-        predict_path = Path(__file__).parent / "predict.py"
-        cmd = [python_exe, str(predict_path), "--input", str(in_path), "--output", str(out_path)]
-
-        st.info("⏳ Running analysis... This may take a few seconds.")
-        try:
-            # Run predict.py without immediately raising exceptions
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            # Show stdout and stderr for debugging
-            if result.stdout.strip():
-                st.text("=== STDOUT ===\n" + result.stdout)
-            if result.stderr.strip():
-                st.text("=== STDERR ===\n" + result.stderr)
-
-            # Check if PDF was created
-            if result.returncode != 0:
-                st.error("❌ Analysis failed (non-zero exit code). Check logs above.")
-                st.stop()
-            elif not out_path.exists():
-                st.error("⚠️ PDF report was not created. Check logs above.")
-                st.stop()
-            else:
-                st.success("🎉 Analysis complete — report generated.")
-
-        except Exception as e:
-            st.error(f"❌ Unexpected error: {e}")
-            st.stop()
-
-        # ---------- DOWNLOAD PDF ---------- #
-        pdf_bytes = out_path.read_bytes()
-        st.download_button(
-            label="📥 Download PDF Report",
-            data=pdf_bytes,
-            file_name="DataScribe_Report.pdf",
-            mime="application/pdf"
-        )
-        st.balloons()
+    # ---------- DOWNLOAD PDF ---------- #
+    st.download_button(
+        label="📥 Download PDF Report",
+        data=pdf_bytes,
+        file_name="DataScribe_Report.pdf",
+        mime="application/pdf"
+    )
+    st.balloons()
@@ -7,60 +7,299 @@ creates charts, and exports a single PDF report with proper headings.
 
 Usage:
     python predict.py --input data.csv --output report.pdf
+    python predict.py --input huge.csv --output stats.pdf --stats-only
 """
 
 import argparse
+import os
 import textwrap
-from typing import List
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Keep compiled kernels across runs even when the source directory is read-only;
+# must be set before numba is imported
+os.environ.setdefault("NUMBA_CACHE_DIR", str(Path.home() / ".cache" / "datascribe" / "numba"))
 
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
-from pandas.plotting import scatter_matrix
-import sys
-print(sys.executable)
+from matplotlib.figure import Figure
+from numba import float64, int64, njit, prange, types, void
 
 plt.switch_backend("Agg")  # For headless environments
 
+# Every fast-math flag except nnan/ninf: the kernels rely on explicit isnan/isfinite checks
+FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# Kernel input matrices may be read-only views (pandas copy-on-write hands those out).
+# Callers pass them column-major, since every kernel walks one column at a time down the
+# rows; the layout is left as "A" because numba types a single-column (or single-row)
+# array as C-contiguous, which an "F" signature would reject
+F8_2D_RO = types.Array(float64, 2, "A", readonly=True)
+
+# How many categorical columns get a bar chart / a pie chart
+CAT_BAR_COLS = 8
+CAT_PIE_COLS = 4
+
+# numba's fallback "workqueue" threading layer aborts on concurrent parallel launches,
+# which concurrent reports (Streamlit serves each session on its own thread) would
+# otherwise trigger; every kernel call takes this lock
+KERNEL_LOCK = threading.Lock()
+
 
 def load_csv_to_df(path: str) -> pd.DataFrame:
-    df = pd.read_csv(path)
+    # Arrow-backed columns: multithreaded parse, and string value_counts run on Arrow's hash kernels
+    try:
+        df = pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow")
+    except pd.errors.ParserError:
+        # The pyarrow engine rejects ragged rows; the C parser pads them with NaN
+        df = pd.read_csv(path, dtype_backend="pyarrow")
     return df
 
 
-def compute_basic_stats(df: pd.DataFrame) -> pd.DataFrame:
-    desc = df.describe(include=[np.number]).T
-    desc["missing"] = df[desc.index].isna().sum()
+@njit(void(F8_2D_RO, int64[::1], float64[::1], float64[::1], float64[::1], float64[::1]),
+      cache=True, fastmath=FASTMATH, parallel=True)
+def col_stats(arr, count, mean, m2, mins, maxs):
+    # Welford update of the per-column moments, in place; NaNs are skipped
+    n, c = arr.shape
+    for j in prange(c):
+        cnt = count[j]
+        mu = mean[j]
+        s = m2[j]
+        lo = mins[j]
+        hi = maxs[j]
+        for i in range(n):
+            x = arr[i, j]
+            if np.isnan(x):
+                continue
+            cnt += 1
+            d = x - mu
+            mu += d / cnt
+            s += d * (x - mu)
+            if cnt == 1 or x < lo:
+                lo = x
+            if cnt == 1 or x > hi:
+                hi = x
+        count[j] = cnt
+        mean[j] = mu
+        m2[j] = s
+        mins[j] = lo
+        maxs[j] = hi
+
+
+def column_stats(df: pd.DataFrame, num_cols: List[str], values: np.ndarray) -> Dict:
+    # values is the Fortran-ordered float64 matrix of num_cols, read once by col_stats.
+    # Per-column arrays under "count"/"mean"/"std"/"min"/"max" line up with "numeric";
+    # "missing" lines up with "columns".
+    k = len(num_cols)
+    stats = {
+        "rows": len(df),
+        "columns": df.columns.tolist(),
+        "numeric": num_cols,
+        "object": df.select_dtypes(include=['object', 'string']).columns.tolist(),
+        "missing": df.isna().sum().to_numpy(dtype=np.int64),
+        "count": np.zeros(k, dtype=np.int64),
+        "mean": np.zeros(k),
+        "m2": np.zeros(k),
+        "min": np.full(k, np.nan),
+        "max": np.full(k, np.nan),
+    }
+    with KERNEL_LOCK:
+        col_stats(np.asfortranarray(values), stats["count"], stats["mean"], stats["m2"], stats["min"], stats["max"])
+    return finish_stats(stats)
+
+
+def finish_stats(stats: Dict) -> Dict:
+    # Turn the Welford state ("count"/"mean"/"m2") into mean and sample std, NaN where undefined
+    count = stats["count"]
+    stats["mean"] = np.where(count > 0, stats["mean"], np.nan)
+    stats["std"] = np.sqrt(np.where(count > 1, stats.pop("m2") / np.maximum(count - 1, 1), np.nan))
+    return stats
+
+
+def stream_stats(path: str, chunksize: int = 200_000) -> Dict:
+    # Same dict as column_stats, accumulated chunk by chunk so memory stays O(chunksize).
+    # col_stats continues the Welford state it is handed, so each chunk just resumes it.
+    # A column is numeric only if every chunk parses it as numbers, as a full read would.
+    columns = pd.read_csv(path, nrows=0).columns.tolist()
+    k = len(columns)
+    rows = 0
+    missing = np.zeros(k, dtype=np.int64)
+    numeric = np.ones(k, dtype=bool)
+    is_object = np.zeros(k, dtype=bool)
+    acc = {
+        "count": np.zeros(k, dtype=np.int64),
+        "mean": np.zeros(k),
+        "m2": np.zeros(k),
+        "min": np.full(k, np.nan),
+        "max": np.full(k, np.nan),
+    }
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        rows += len(chunk)
+        missing += chunk.isna().sum().to_numpy(dtype=np.int64)
+        numeric &= chunk.columns.isin(chunk.select_dtypes(include=[np.number]).columns)
+        is_object |= chunk.columns.isin(chunk.select_dtypes(include=['object', 'string']).columns)
+        idx = np.flatnonzero(numeric)
+        part = {key: arr[idx] for key, arr in acc.items()}
+        values = np.asfortranarray(chunk.iloc[:, idx].to_numpy(dtype=np.float64, na_value=np.nan))
+        with KERNEL_LOCK:
+            col_stats(values, part["count"], part["mean"], part["m2"], part["min"], part["max"])
+        for key, arr in acc.items():
+            arr[idx] = part[key]
+
+    idx = np.flatnonzero(numeric)
+    stats = {
+        "rows": rows,
+        "columns": columns,
+        "numeric": [columns[i] for i in idx],
+        "object": [columns[i] for i in np.flatnonzero(is_object)],
+        "missing": missing,
+    }
+    stats.update({key: arr[idx] for key, arr in acc.items()})
+    return finish_stats(stats)
+
+
+def compute_basic_stats(stats: Dict, na_per_col: pd.Series,
+                        values: Optional[np.ndarray] = None) -> pd.DataFrame:
+    table = {key: stats[key] for key in ("count", "mean", "std", "min")}
+    # Quartiles as in describe(); three kth-partitions per column, no full sort. They need
+    # the whole column in memory, so streamed stats (no values) go without them.
+    if values is not None:
+        quartiles = np.full((len(stats["numeric"]), 3), np.nan)
+        for i in range(len(stats["numeric"])):
+            col = column_values(values, i)
+            if col.size:
+                quartiles[i] = np.quantile(col, [0.25, 0.5, 0.75])
+        table.update({"25%": quartiles[:, 0], "50%": quartiles[:, 1], "75%": quartiles[:, 2]})
+    table["max"] = stats["max"]
+    desc = pd.DataFrame(table, index=stats["numeric"])
+    desc["missing"] = na_per_col[stats["numeric"]]
     return desc
 
 
 def detect_categoricals(df: pd.DataFrame, max_unique: int = 20) -> List[str]:
-    cats = []
-    for col in df.columns:
-        if df[col].dtype == "object":
-            cats.append(col)
-        else:
-            if df[col].nunique(dropna=True) <= max_unique:
-                cats.append(col)
-    return cats
-
-
-def add_text_page(pdf: PdfPages, title: str, body: str) -> None:
-    fig, ax = plt.subplots(figsize=(11, 8.5))
+    obj = df.select_dtypes(include=['object', 'string']).columns
+    nun = df.drop(columns=obj).nunique(dropna=True)
+    mask = df.columns.isin(obj) | df.columns.isin(nun.index[nun <= max_unique])
+    return df.columns[mask].tolist()
+
+
+def categorical_counts(df: pd.DataFrame, cat_cols: List[str]) -> Dict[str, pd.Series]:
+    # No astype(str) round-trip: Arrow/str columns count natively, and missing values
+    # stay a bucket of their own as they were when stringified
+    return {col: df[col].value_counts(dropna=False) for col in cat_cols}
+
+
+def column_values(values: np.ndarray, i: int) -> np.ndarray:
+    col = values[:, i]
+    return col[~np.isnan(col)]
+
+
+def bin_ranges(cols: np.ndarray):
+    # Per-column (min, max) over the finite values, widened like np.histogram for empty/flat
+    # columns; the binning kernels skip NaN and +-inf, so every binned value lands in range
+    finite = np.isfinite(cols)
+    mins = np.fmin.reduce(cols, axis=0, where=finite, initial=np.inf).astype(np.float64)
+    maxs = np.fmax.reduce(cols, axis=0, where=finite, initial=-np.inf).astype(np.float64)
+    empty = mins > maxs
+    mins[empty] = 0.0
+    maxs[empty] = 1.0
+    flat = maxs <= mins
+    mins[flat] -= 0.5
+    maxs[flat] += 0.5
+    return mins, maxs
+
+
+@njit(int64[:, ::1](F8_2D_RO, float64[::1], float64[::1], int64),
+      cache=True, fastmath=FASTMATH, parallel=True)
+def col_hist(arr, mins, maxs, bins):
+    n, c = arr.shape
+    counts = np.zeros((c, bins), dtype=np.int64)
+    for j in prange(c):
+        scale = bins / (maxs[j] - mins[j])
+        for i in range(n):
+            x = arr[i, j]
+            if not np.isfinite(x):
+                continue
+            counts[j, min(int((x - mins[j]) * scale), bins - 1)] += 1
+    return counts
+
+
+def column_histograms(values: np.ndarray, bins: int):
+    # Bin every column in one kernel call; edges[c] are the bin edges of column c
+    cols = np.asfortranarray(values)
+    mins, maxs = bin_ranges(cols)
+    with KERNEL_LOCK:
+        counts = col_hist(cols, mins, maxs, bins)
+    edges = np.linspace(mins, maxs, bins + 1, axis=1)
+    return counts, edges
+
+
+@njit(void(F8_2D_RO, int64, float64[::1], float64[::1], int64[:, :, :, ::1]),
+      cache=True, fastmath=FASTMATH, parallel=True)
+def hist2d_grid(cols, bins, mins, maxs, out):
+    # out[i, j] is the (y=col i, x=col j) 2D histogram; only i >= j is filled
+    n, k = cols.shape
+    for p in prange(k * k):
+        i = p // k
+        j = p % k
+        if j > i:
+            continue
+        sx = bins / (maxs[j] - mins[j])
+        sy = bins / (maxs[i] - mins[i])
+        for r in range(n):
+            x = cols[r, j]
+            y = cols[r, i]
+            if not (np.isfinite(x) and np.isfinite(y)):
+                continue
+            bx = min(int((x - mins[j]) * sx), bins - 1)
+            by = min(int((y - mins[i]) * sy), bins - 1)
+            out[i, j, by, bx] += 1
+
+
+def downsample(a: np.ndarray, n: int = 50_000) -> np.ndarray:
+    # A chart panel can't show more than a few thousand distinct points anyway
+    if a.size <= n:
+        return a
+    return a[np.random.default_rng(0).choice(a.size, n, replace=False)]
+
+
+def quantile_sample(a: np.ndarray, n: int = 50_000) -> np.ndarray:
+    # Evenly spaced order statistics: keeps quartiles, whiskers and extremes intact
+    if a.size <= n:
+        return a
+    # One sort plus a gather; np.quantile with this many q's partitions once per q
+    idx = np.linspace(0, a.size - 1, n).round().astype(np.intp)
+    return np.sort(a)[idx]
+
+
+def warm_kernels() -> None:
+    # Kernels are compiled (or loaded from cache) at import via their signatures;
+    # one tiny launch each also starts numba's parallel thread pool ahead of the first report
+    arr = np.zeros((8, 2), order="F")
+    lo, hi = np.zeros(2), np.ones(2)
+    with KERNEL_LOCK:
+        col_stats(arr, np.zeros(2, dtype=np.int64), np.zeros(2), np.zeros(2), np.zeros(2), np.zeros(2))
+        col_hist(arr, lo, hi, 4)
+        hist2d_grid(arr, 4, lo, hi, np.zeros((2, 2, 4, 4), dtype=np.int64))
+
+
+def add_text_page(pdf: PdfPages, ax, title: str, body: str) -> None:
+    ax.clear()
     ax.axis("off")
     wrapped = textwrap.fill(body, width=110)
     ax.text(0.02, 0.95, title, fontsize=18, fontweight="bold", va="top")
     ax.text(0.02, 0.90, wrapped, fontsize=11, va="top")
-    fig.tight_layout()
-    pdf.savefig(fig)
-    plt.close(fig)
+    ax.figure.tight_layout()
+    pdf.savefig(ax.figure)
 
 
-def save_stats_table(desc: pd.DataFrame, pdf: PdfPages, title: str) -> None:
+def save_stats_table(desc: pd.DataFrame, pdf: PdfPages, ax, title: str) -> None:
     if desc.empty:
         return
-    fig, ax = plt.subplots(figsize=(11, 8.5))
+    ax.clear()
     ax.axis("off")
     display_df = desc.head(12).round(4)
     table = ax.table(cellText=display_df.values,
@@ -71,149 +310,201 @@ def save_stats_table(desc: pd.DataFrame, pdf: PdfPages, title: str) -> None:
     table.set_fontsize(8)
     table.scale(1, 1.4)
     ax.set_title(title, pad=20, fontsize=14, fontweight="bold")
-    fig.tight_layout()
-    pdf.savefig(fig)
-    plt.close(fig)
+    ax.figure.tight_layout()
+    pdf.savefig(ax.figure)
 
 
 # --------------------- PLOTS --------------------- #
 
-def plot_missingness(df: pd.DataFrame, pdf: PdfPages) -> None:
-    missing = df.isna().sum().sort_values(ascending=False)
-    fig, ax = plt.subplots(figsize=(10, 5))
+def plot_missingness(na_per_col: pd.Series) -> List[Figure]:
+    missing = na_per_col.sort_values(ascending=False)
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
     missing.plot(kind="bar", ax=ax)
     ax.set_title("Missing Values per Column", fontsize=14, fontweight="bold")
     ax.set_ylabel("Count of NaNs")
     ax.set_xlabel("Columns")
     fig.tight_layout()
-    pdf.savefig(fig)
-    plt.close(fig)
-
-
-def plot_histograms(df: pd.DataFrame, pdf: PdfPages, bins: int = 30, max_cols: int = 12) -> None:
-    num_cols = df.select_dtypes(include=[np.number]).columns.tolist()[:max_cols]
-    for col in num_cols:
-        fig, ax = plt.subplots(figsize=(8, 4))
-        ax.hist(df[col].dropna(), bins=bins)
+    return [fig]
+
+
+def plot_histograms(values: np.ndarray, num_cols: List[str],
+                    bins: int = 30, max_cols: int = 12) -> List[Figure]:
+    figs = []
+    num_cols = num_cols[:max_cols]
+    counts, edges = column_histograms(values[:, :len(num_cols)], bins)
+    for i, col in enumerate(num_cols):
+        fig = Figure(figsize=(8, 4))
+        ax = fig.subplots()
+        ax.stairs(counts[i], edges[i], fill=True)
         ax.set_title(f"Histogram: {col}", fontsize=12, fontweight="bold")
         ax.set_xlabel(col)
         ax.set_ylabel("Frequency")
         fig.tight_layout()
-        pdf.savefig(fig)
-        plt.close(fig)
+        figs.append(fig)
+    return figs
 
 
-def plot_categorical_bars(df: pd.DataFrame, pdf: PdfPages, top_k: int = 15, max_cols: int = 8) -> None:
-    cats = detect_categoricals(df)[:max_cols]
-    for col in cats:
-        counts = df[col].astype(str).value_counts().head(top_k)
-        fig, ax = plt.subplots(figsize=(10, 5))
+def plot_categorical_bars(cat_counts: Dict[str, pd.Series],
+                          top_k: int = 15, max_cols: int = CAT_BAR_COLS) -> List[Figure]:
+    figs = []
+    for col, counts in list(cat_counts.items())[:max_cols]:
+        counts = counts.head(top_k)
+        fig = Figure(figsize=(10, 5))
+        ax = fig.subplots()
         counts.plot(kind="bar", ax=ax)
         ax.set_title(f"Top {top_k} Values: {col}", fontsize=12, fontweight="bold")
         ax.set_ylabel("Count")
         ax.set_xlabel(col)
         fig.tight_layout()
-        pdf.savefig(fig)
-        plt.close(fig)
-
-
-def plot_correlation_heatmap(df: pd.DataFrame, pdf: PdfPages) -> None:
-    num_df = df.select_dtypes(include=[np.number])
-    if num_df.shape[1] < 2:
-        return
-    corr = num_df.corr(numeric_only=True)
-    fig, ax = plt.subplots(figsize=(8, 6))
+        figs.append(fig)
+    return figs
+
+
+def plot_correlation_heatmap(values: np.ndarray, means: np.ndarray, num_cols: List[str]) -> List[Figure]:
+    if len(num_cols) < 2:
+        return []
+    # Mean-impute NaNs (column means from the stats pass) so the whole matrix goes
+    # through one BLAS-backed corrcoef
+    with np.errstate(all="ignore"):
+        corr = np.corrcoef(np.where(np.isnan(values), means, values), rowvar=False)
+    fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
     cax = ax.imshow(corr, aspect='auto', interpolation='nearest')
     ax.set_title("Correlation Heatmap", fontsize=14, fontweight="bold")
-    ax.set_xticks(range(len(corr.columns)))
-    ax.set_yticks(range(len(corr.columns)))
-    ax.set_xticklabels(corr.columns, rotation=90)
-    ax.set_yticklabels(corr.columns)
+    ax.set_xticks(range(len(num_cols)))
+    ax.set_yticks(range(len(num_cols)))
+    ax.set_xticklabels(num_cols, rotation=90)
+    ax.set_yticklabels(num_cols)
     fig.colorbar(cax, ax=ax, fraction=0.046, pad=0.04)
     fig.tight_layout()
-    pdf.savefig(fig)
-    plt.close(fig)
+    return [fig]
 
 
-def plot_boxplots(df: pd.DataFrame, pdf: PdfPages, max_cols: int = 8) -> None:
-    num_cols = df.select_dtypes(include=[np.number]).columns.tolist()[:max_cols]
-    for col in num_cols:
-        fig, ax = plt.subplots(figsize=(6, 4))
-        ax.boxplot(df[col].dropna(), vert=True)
+def plot_boxplots(values: np.ndarray, num_cols: List[str], max_cols: int = 8) -> List[Figure]:
+    figs = []
+    for i, col in enumerate(num_cols[:max_cols]):
+        fig = Figure(figsize=(6, 4))
+        ax = fig.subplots()
+        ax.boxplot(quantile_sample(column_values(values, i)), vert=True)
         ax.set_title(f"Boxplot: {col}", fontsize=12, fontweight="bold")
         ax.set_ylabel(col)
-        pdf.savefig(fig)
-        plt.close(fig)
+        figs.append(fig)
+    return figs
 
 
-def plot_violinplots(df: pd.DataFrame, pdf: PdfPages, max_cols: int = 6) -> None:
-    num_cols = df.select_dtypes(include=[np.number]).columns.tolist()[:max_cols]
-    for col in num_cols:
-        fig, ax = plt.subplots(figsize=(6, 4))
-        ax.violinplot(df[col].dropna(), showmeans=True)
+def plot_violinplots(values: np.ndarray, num_cols: List[str], max_cols: int = 6) -> List[Figure]:
+    figs = []
+    for i, col in enumerate(num_cols[:max_cols]):
+        fig = Figure(figsize=(6, 4))
+        ax = fig.subplots()
+        ax.violinplot(downsample(column_values(values, i)), showmeans=True)
         ax.set_title(f"Violin Plot: {col}", fontsize=12, fontweight="bold")
         ax.set_ylabel(col)
-        pdf.savefig(fig)
-        plt.close(fig)
+        figs.append(fig)
+    return figs
 
 
-def plot_density_plots(df: pd.DataFrame, pdf: PdfPages, max_cols: int = 8) -> None:
+def plot_density_plots(values: np.ndarray, num_cols: List[str], max_cols: int = 8) -> List[Figure]:
     # Density plots without requiring scipy
-    num_cols = df.select_dtypes(include=[np.number]).columns.tolist()[:max_cols]
-    for col in num_cols:
-        data = df[col].dropna()
-        if data.empty:
+    figs = []
+    num_cols = num_cols[:max_cols]
+    counts, edges = column_histograms(values[:, :len(num_cols)], 30)
+    for i, col in enumerate(num_cols):
+        total = counts[i].sum()
+        if total == 0:
             continue
-        fig, ax = plt.subplots(figsize=(6, 4))
-        ax.hist(data, bins=30, density=True, alpha=0.5, label="Histogram")
-        data.plot(kind="hist", bins=30, density=True, alpha=0.3, ax=ax)  # smooth histogram
+        density = counts[i] / (total * np.diff(edges[i]))
+        smoothed = np.convolve(density, np.ones(3) / 3, mode="same")  # 3-bin moving average
+        centers = (edges[i][:-1] + edges[i][1:]) / 2
+        fig = Figure(figsize=(6, 4))
+        ax = fig.subplots()
+        ax.stairs(density, edges[i], fill=True, alpha=0.5, label="Histogram")
+        ax.plot(centers, smoothed, label="Smoothed")
         ax.set_title(f"Approx Density Plot: {col}", fontsize=12, fontweight="bold")
         ax.set_xlabel(col)
         ax.legend()
-        pdf.savefig(fig)
-        plt.close(fig)
-
-
-def plot_scatter_matrix(df: pd.DataFrame, pdf: PdfPages, max_cols: int = 5) -> None:
-    num_cols = df.select_dtypes(include=[np.number]).columns.tolist()[:max_cols]
-    if len(num_cols) > 1:
-        fig = scatter_matrix(df[num_cols], figsize=(10, 10), diagonal="kde")
-        plt.suptitle("Scatter Matrix", y=1.02, fontsize=14, fontweight="bold")
-        pdf.savefig(fig[0][0].figure)
-        plt.close(fig[0][0].figure)
-
-
-def plot_line_charts(df: pd.DataFrame, pdf: PdfPages, max_cols: int = 6) -> None:
-    num_cols = df.select_dtypes(include=[np.number]).columns.tolist()[:max_cols]
-    if num_cols:
-        fig, ax = plt.subplots(figsize=(10, 5))
-        df[num_cols].plot(ax=ax)
-        ax.set_title("Line Chart (first few numeric cols)", fontsize=12, fontweight="bold")
-        pdf.savefig(fig)
-        plt.close(fig)
-
-
-def plot_pie_charts(df: pd.DataFrame, pdf: PdfPages, max_cols: int = 4) -> None:
-    cats = detect_categoricals(df)[:max_cols]
-    for col in cats:
-        counts = df[col].astype(str).value_counts().head(6)
-        fig, ax = plt.subplots(figsize=(6, 6))
-        counts.plot(kind="pie", autopct="%1.1f%%", ax=ax)
-        ax.set_ylabel("")
+        figs.append(fig)
+    return figs
+
+
+def plot_scatter_matrix(values: np.ndarray, num_cols: List[str],
+                        max_cols: int = 5, bins: int = 64) -> List[Figure]:
+    # Binned density grid instead of drawing every point: cost is fixed by bins, not rows
+    num_cols = num_cols[:max_cols]
+    k = len(num_cols)
+    if k < 2:
+        return []
+    cols = np.asfortranarray(values[:, :k])
+    mins, maxs = bin_ranges(cols)
+    out = np.zeros((k, k, bins, bins), dtype=np.int64)
+    with KERNEL_LOCK:
+        hist2d_grid(cols, bins, mins, maxs, out)
+
+    fig = Figure(figsize=(10, 10))
+    axes = fig.subplots(k, k)
+    for i in range(k):
+        for j in range(k):
+            ax = axes[i, j]
+            if i == j:
+                edges = np.linspace(mins[j], maxs[j], bins + 1)
+                ax.stairs(np.diagonal(out[i, i]), edges, fill=True)
+                ax.set_xlim(mins[j], maxs[j])
+            else:
+                grid = out[i, j] if i > j else out[j, i].T
+                ax.imshow(np.log1p(grid), origin="lower", aspect="auto",
+                          extent=(mins[j], maxs[j], mins[i], maxs[i]), interpolation="nearest")
+            ax.tick_params(labelsize=7)
+            if i < k - 1:
+                ax.set_xticklabels([])
+            else:
+                ax.set_xlabel(num_cols[j])
+            if j > 0:
+                ax.set_yticklabels([])
+            else:
+                ax.set_ylabel(num_cols[i])
+    fig.suptitle("Scatter Matrix (binned density)", fontsize=14, fontweight="bold")
+    return [fig]
+
+
+def plot_line_charts(df: pd.DataFrame, num_cols: List[str], max_cols: int = 6) -> List[Figure]:
+    num_cols = num_cols[:max_cols]
+    if not num_cols:
+        return []
+    # dpi pins the resolution the rasterized lines are embedded at
+    fig = Figure(figsize=(10, 5), dpi=100)
+    ax = fig.subplots()
+    # Stride to ~5000 points per line; keeps the trend shape of long series
+    df[num_cols].iloc[::max(1, len(df) // 5000)].plot(ax=ax)
+    # Thousands of vertices per line: embed them as one bitmap, keep axes and text vector
+    for line in ax.get_lines():
+        line.set_rasterized(True)
+    ax.set_title("Line Chart (first few numeric cols)", fontsize=12, fontweight="bold")
+    return [fig]
+
+
+def plot_pie_charts(cat_counts: Dict[str, pd.Series], max_cols: int = CAT_PIE_COLS) -> List[Figure]:
+    figs = []
+    for col, counts in list(cat_counts.items())[:max_cols]:
+        counts = counts.head(6)
+        total = counts.sum()
+        # Percentages baked into the labels once instead of an autopct callback per wedge
+        labels = [f"{k}\n{v / total:.1%}" for k, v in counts.items()]
+        fig = Figure(figsize=(6, 6))
+        ax = fig.subplots()
+        ax.pie(counts.to_numpy(dtype=np.float64), labels=labels)
         ax.set_title(f"Pie Chart: {col}", fontsize=12, fontweight="bold")
-        pdf.savefig(fig)
-        plt.close(fig)
+        figs.append(fig)
+    return figs
 
 
 # --------------------- MAIN PIPELINE --------------------- #
 
-def summary_text(df: pd.DataFrame, desc: pd.DataFrame) -> str:
+def summary_text(stats: Dict, desc: pd.DataFrame, na_per_col: pd.Series) -> str:
     lines = []
-    lines.append(f"Rows: {df.shape[0]}, Columns: {df.shape[1]}")
-    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-    object_cols = df.select_dtypes(include=['object']).columns.tolist()
-    lines.append(f"Numeric columns: {len(numeric_cols)} | Categorical/object columns: {len(object_cols)}")
-    missing_total = int(df.isna().sum().sum())
+    lines.append(f"Rows: {stats['rows']}, Columns: {len(stats['columns'])}")
+    lines.append(f"Numeric columns: {len(stats['numeric'])} | Categorical/object columns: {len(stats['object'])}")
+    missing_total = int(na_per_col.sum())
     lines.append(f"Total missing values: {missing_total}")
     if not desc.empty:
         means = desc['mean'].dropna().to_dict()
@@ -223,45 +514,82 @@ def summary_text(df: pd.DataFrame, desc: pd.DataFrame) -> str:
     return "\n".join(lines)
 
 
-def analyze_to_pdf(csv_path: str, out_pdf: str) -> None:
-    df = load_csv_to_df(csv_path)
-    desc = compute_basic_stats(df)
+def analyze_to_pdf(df: pd.DataFrame, out_pdf: str) -> None:
+    num_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    # One dense float64 copy of the numeric columns, shared by the stats pass and the
+    # plots; to_numpy usually hands back a column-major block already, so this is rarely a copy
+    values = np.asfortranarray(df[num_cols].to_numpy(dtype=np.float64, na_value=np.nan))
+    stats = column_stats(df, num_cols, values)
+    na_per_col = pd.Series(stats["missing"], index=stats["columns"])
+    desc = compute_basic_stats(stats, na_per_col, values)
+    cat_cols = detect_categoricals(df)
+    # Shared by the bar charts and the pie charts
+    cat_counts = categorical_counts(df, cat_cols[:max(CAT_BAR_COLS, CAT_PIE_COLS)])
+
+    # The text and table pages share one page figure, redrawn for each page
+    page_ax = Figure(figsize=(11, 8.5)).subplots()
 
     with PdfPages(out_pdf) as pdf:
         # Summary page
-        add_text_page(pdf, "Dataset Summary", summary_text(df, desc))
+        add_text_page(pdf, page_ax, "Dataset Summary", summary_text(stats, desc, na_per_col))
 
         # Stats table
-        save_stats_table(desc, pdf, "Descriptive Statistics (Numeric)")
-
-        # Visualizations
-        plot_missingness(df, pdf)
-        plot_histograms(df, pdf)
-        plot_categorical_bars(df, pdf)
-        plot_correlation_heatmap(df, pdf)
-        plot_boxplots(df, pdf)
-        plot_violinplots(df, pdf)
-        plot_density_plots(df, pdf)
-        plot_scatter_matrix(df, pdf)
-        plot_line_charts(df, pdf)
-        plot_pie_charts(df, pdf)
+        save_stats_table(desc, pdf, page_ax, "Descriptive Statistics (Numeric)")
+
+        # Visualizations, in report order; each batch of figures is written as soon as
+        # it is built
+        plots = [
+            (plot_missingness, na_per_col),
+            (plot_histograms, values, num_cols),
+            (plot_categorical_bars, cat_counts),
+            (plot_correlation_heatmap, values, stats["mean"], num_cols),
+            (plot_boxplots, values, num_cols),
+            (plot_violinplots, values, num_cols),
+            (plot_density_plots, values, num_cols),
+            (plot_scatter_matrix, values, num_cols),
+            (plot_line_charts, df, num_cols),
+            (plot_pie_charts, cat_counts),
+        ]
+        for plot, *args in plots:
+            for fig in plot(*args):
+                pdf.savefig(fig)
 
         # Closing notes
-        add_text_page(pdf, "Notes",
+        add_text_page(pdf, page_ax, "Notes",
                       "This report was auto-generated. Graphs are limited in number for readability. "
                       "Consider domain-specific EDA for deeper insights.")
 
 
+def analyze_csv_to_pdf(csv_path: str, out_pdf: str) -> None:
+    analyze_to_pdf(load_csv_to_df(csv_path), out_pdf)
+
+
+def stats_csv_to_pdf(csv_path: str, out_pdf: str) -> None:
+    # Summary and stats pages only, streamed from the CSV for files too large to load
+    stats = stream_stats(csv_path)
+    na_per_col = pd.Series(stats["missing"], index=stats["columns"])
+    desc = compute_basic_stats(stats, na_per_col)
+    page_ax = Figure(figsize=(11, 8.5)).subplots()
+    with PdfPages(out_pdf) as pdf:
+        add_text_page(pdf, page_ax, "Dataset Summary", summary_text(stats, desc, na_per_col))
+        save_stats_table(desc, pdf, page_ax, "Descriptive Statistics (Numeric)")
+
+
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser()
     p.add_argument("--input", "-i", required=True, help="Path to input CSV")
     p.add_argument("--output", "-o", required=True, help="Path to output PDF")
+    p.add_argument("--stats-only", action="store_true",
+                   help="Stream the CSV in chunks and write only the summary and stats pages")
     return p.parse_args()
 
 
 def main():
     args = parse_args()
-    analyze_to_pdf(args.input, args.output)
+    if args.stats_only:
+        stats_csv_to_pdf(args.input, args.output)
+    else:
+        analyze_csv_to_pdf(args.input, args.output)
 
 
 if __name__ == "__main__":